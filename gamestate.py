@@ -1,273 +1,574 @@
-"""Class for keeping track of Wordle game state and providing choices"""
-import heapq
-import math
-import random
-import re
-from collections import Counter, defaultdict
-from copy import deepcopy
-from typing import List
-
-
-class GameState:
-    """
-    Class for keeping track of Wordle game state and providing choices
-    """
-
-    MAX_MONTE_CARLO_SIMILATED_OUTCOMES = 50_000
-    TOTAL_GUESSES = 6
-    HIDDEN_WORD_LENGTH = 5
-    MAX_CONSIDERED_GOOD_GUESSES = 50
-    GAME_LOST_PENALTY_MULTIPLIER = 10
-    LETTER_KNOWN_PENALTY = 0.01
-
-    def __init__(self, dictionary: List[str], **kwargs):
-        self.dictionary = dictionary
-        self.remaining_words = kwargs.get("remaining_words", dictionary)
-        self.total_guesses = kwargs.get("total_guesses", self.TOTAL_GUESSES)
-        self.verbose = kwargs.get("verbose", False)
-        self.excluded_letters = kwargs.get("excluded_letters", set())
-        self.included_letters = kwargs.get("included_letters", set())
-        self.included_letter_positions = kwargs.get("included_letter_positions", {})
-        self.included_letter_not_positions = kwargs.get("included_letter_not_positions", defaultdict(set))
-        self.previous_tries = []
-
-    def __matches_letter_positions(self, word: str) -> bool:
-        """
-        Takes a word and checks to see if the letters in the word matches the letter positions of the hidden word.
-
-        :param word: The word we are checking
-        :return: True if the word has the correct letters in the correct positions, else False
-        """
-        characters_not_matched = list(self.included_letter_positions)
-        for i, v in enumerate(word):
-            if self.included_letter_positions.get(v, None) == i:
-                characters_not_matched.remove(v)
-        return len(characters_not_matched) == 0
-
-    def __get_new_remaining_words(self, guessed_word: str) -> List[str]:
-        """
-        Given the guessed word, remove all words that can no longer be the hidden word.
-
-        :param guessed_word: The word that was guessed
-        :return: The list of updated potential hidden words
-        """
-        return [
-            word
-            for word in self.remaining_words
-            if not (set(word) & self.excluded_letters)
-            and len(set(word) & self.included_letters) == len(self.included_letters)
-            and self.__matches_letter_positions(word)
-            # if we know an included character is not in a location remove those words
-            and not any(i in self.included_letter_not_positions[c] for i, c in enumerate(word)) and word != guessed_word
-        ]
-
-    def is_game_over(self) -> bool:
-        """
-        Checks to see if the game is over.
-
-        :return: True if the game is over, else False
-        """
-        return (
-            len(self.previous_tries) >= self.total_guesses
-            or len(self.included_letter_positions) == self.HIDDEN_WORD_LENGTH
-        )
-
-    def update_with_text_outcome(self, guessed_word: str, outcome: str) -> None:
-        """
-        Updates the game state given the guessed word and the outcome of that guess.
-        The outcome is a string of a special format. The format is letters for letters that matched and letters followed
-        by a number of the index if the letter matched a position. The index starts from 0 and goes to a maximum of 4.
-
-        Some examples of valid outcome strings would be:
-        stba
-        s0t4b1a
-        st4ba
-
-        :param guessed_word: The word that was guessed
-        :param outcome:  The outcome of that guess
-        :return: None
-        """
-        self.previous_tries.append(guessed_word)
-
-        self.included_letters |= set(re.sub(r"\d", "", outcome))
-        self.excluded_letters |= {c for c in guessed_word if c not in self.included_letters}
-
-        position_values = ["" for _ in range(self.HIDDEN_WORD_LENGTH)]
-        for i, character in enumerate(outcome):
-            if character.isnumeric():
-                position_values[int(character)] = outcome[i - 1]
-
-        for i, c in enumerate(guessed_word):
-            if c == position_values[i]:
-                self.included_letter_positions[c] = i
-            elif c in self.included_letters:
-                self.included_letter_not_positions[c].add(i)
-
-        self.remaining_words = self.__get_new_remaining_words(guessed_word)
-
-    def update_with_hidden_word(self, guessed_word: str, hidden_word: str) -> None:
-        """
-        Updates the game state given the guessed word and the known hidden word.
-
-        :param guessed_word: The word that was guessed
-        :param hidden_word: The hidden word you are trying to find
-        :return: None
-        """
-        if self.verbose:
-            print(f"Guessing {guessed_word}")
-
-        self.previous_tries.append(guessed_word)
-
-        self.included_letters |= set(guessed_word) & set(hidden_word)
-        self.excluded_letters |= {c for c in guessed_word if c not in hidden_word}
-
-        for i, c in enumerate(guessed_word):
-            if c == hidden_word[i]:
-                self.included_letter_positions[c] = i
-            elif c in self.included_letters:
-                self.included_letter_not_positions[c].add(i)
-
-        self.remaining_words = self.__get_new_remaining_words(guessed_word)
-
-    def get_best_guess(self) -> str:
-        """
-        Gets the best guess given the algorithm.
-        The algorithm takes the letters remaining in all the words that could potentially be the hidden word. It
-        counts all the letters and then creates a weighted score for all letters based on letters remaining and
-        the amount of information gain for each letter. It then takes the top X words in the entire dictionary based
-        on the letter scoring and randomly selects one of them as the best guess.
-
-        :return:
-        """
-        if len(self.remaining_words) <= 2:
-            return random.choice(self.remaining_words)
-
-        character_counter = Counter("".join(self.remaining_words))
-
-        for c in self.included_letters:
-
-            if c in self.included_letter_positions:
-                # We gain no new information from included letters with positions
-                character_counter[c] = 0
-            else:
-                # We gain some information from included letters with no positions
-                character_counter[c] *= self.LETTER_KNOWN_PENALTY
-
-        max_occurance = max(character_counter.values())
-        character_scores = {c: v / max(1, max_occurance) for c, v in character_counter.items()}
-
-        word_scores_heap = []
-        for word in (
-            self.dictionary
-            if (
-                (len(character_counter) != len(self.included_letters))
-                and (self.total_guesses > len(self.previous_tries) + 1)
-                and len(self.remaining_words) > 2
-            )
-            else self.remaining_words
-        ):
-            score = sum(character_scores.get(c, 0) for c in set(word))
-            if len(word_scores_heap) < max(
-                min(math.ceil(len(self.remaining_words) / 5), self.MAX_CONSIDERED_GOOD_GUESSES), 5
-            ):
-                heapq.heappush(word_scores_heap, (score, word))
-            elif score > word_scores_heap[0][0]:
-                heapq.heapreplace(word_scores_heap, (score, word))
-
-        solution_words = [v[1] for v in word_scores_heap]
-        if len(self.remaining_words) <= 5:
-            solution_words = list(set(solution_words) | set(self.remaining_words))
-
-        return random.choice(solution_words)
-
-    def deepcopy(self):  # -> GameState
-        """
-        Returns a deep copy of the game state for certain member variables.
-
-        :return: Deep copy of a portion of the GameState
-        """
-        return GameState(
-            self.dictionary,
-            remaining_words=list(self.remaining_words),
-            total_guesses=self.total_guesses - len(self.previous_tries),
-            excluded_letters=set(self.excluded_letters),
-            included_letters=set(self.included_letters),
-            included_letter_positions=dict(self.included_letter_positions),
-            included_letter_not_positions=deepcopy(self.included_letter_not_positions),
-        )
-
-    def get_percentage_chance_of_winning(self, guess_word, number_of_simulations=2000):
-        """
-        If the given guess word used next, what is the percentage chance of winning the game. This is calculated using
-        X number of game simulations with randomly selected hidden words from the remaining hidden words.
-
-        :param guess_word: The guess word
-        :param number_of_simulations: The number of times we want to simulate the outcome
-        :return: The win rate percentage
-        """
-        outcomes = []
-        for _ in range(number_of_simulations):
-            hidden_word = random.choice(self.remaining_words)
-            if guess_word == hidden_word:
-                outcomes.append(True)
-                continue
-
-            monte_carlo_game_state = self.deepcopy()
-
-            monte_carlo_game_state.update_with_hidden_word(guess_word, hidden_word)
-            while not monte_carlo_game_state.is_game_over():
-                best_guess = monte_carlo_game_state.get_best_guess()
-                monte_carlo_game_state.update_with_hidden_word(best_guess, hidden_word)
-                if best_guess == hidden_word:
-                    outcomes.append(True)
-                    break
-            else:
-                outcomes.append(False)
-        return sum(outcomes) / len(outcomes)
-
-    def get_monte_carlo_choices(self, limit=5):
-        """
-        Gets the top X word choices for the current game state. This is calculated using Monte Carlo.
-
-        :param limit: The number of choices to return
-        :return: The list of word choices with the percentage chance of a win.
-        """
-
-        if len(self.previous_tries) == 0:
-            return [
-                (3.959705882352941, "dates"),
-                (3.970299884659746, "dales"),
-                (3.971229293809939, "dares"),
-                (3.984014209591474, "lanes"),
-                (3.988081725312145, "rates"),
-            ]
-
-        number_of_simulations = min(len(self.remaining_words) * 50, self.MAX_MONTE_CARLO_SIMILATED_OUTCOMES)
-        choice_outcomes = defaultdict(list)
-        for _ in range(number_of_simulations):
-            hidden_word = random.choice(self.remaining_words)
-            monte_carlo_game_state = self.deepcopy()
-            while not monte_carlo_game_state.is_game_over():
-                best_guess = monte_carlo_game_state.get_best_guess()
-                monte_carlo_game_state.update_with_hidden_word(best_guess, hidden_word)
-                if best_guess == hidden_word:
-                    choice_outcomes[monte_carlo_game_state.previous_tries[0]].append(
-                        len(monte_carlo_game_state.previous_tries + self.previous_tries)
-                    )
-                    break
-            else:
-                choice_outcomes[monte_carlo_game_state.previous_tries[0]].append(
-                    len(monte_carlo_game_state.previous_tries + self.previous_tries) * self.GAME_LOST_PENALTY_MULTIPLIER
-                )
-
-        return sorted([(sum(outcomes) / float(len(outcomes)), word) for word, outcomes in choice_outcomes.items()])[
-            :limit
-        ]
-
-    def get_monte_carlo_choice(self):
-        """
-        Gets the top monte carlo word choice given the current game state.
-
-        :return: Word with the top win rate given the current game state
-        """
-        return self.get_monte_carlo_choices(limit=1)[0][1]
+"""Class for keeping track of Wordle game state and providing choices"""
+import hashlib
+import math
+import random
+from collections import defaultdict
+from typing import List
+
+import numpy as np
+
+try:
+    import rollout
+except ImportError:  # numba is an optional speedup; fall back to the pure-Python rollouts
+    rollout = None
+
+
+class DictionaryIndex:
+    """
+    Immutable precomputed structures for a dictionary of words, shared by every GameState copy
+    """
+
+    __slots__ = ("words", "words_array", "word_index", "codes", "presence", "presence_bool", "bitmask", "pos_has")
+
+    WORD_LENGTH = 5
+
+    def __init__(self, words: List[str]):
+        self.words = words
+        self.words_array = np.array(words)
+        self.word_index = {word: i for i, word in enumerate(words)}
+        # Every word as a row of letter codes 0-25 so filters can run as NumPy masks
+        self.codes = np.frombuffer("".join(words).encode(), dtype=np.uint8).reshape(-1, self.WORD_LENGTH) - ord("a")
+        # presence[w, c] is how many times letter c appears in word w
+        self.presence = np.zeros((len(words), 26), dtype=np.uint8)
+        np.add.at(self.presence, (np.arange(len(words))[:, None], self.codes), 1)
+        self.presence_bool = self.presence > 0
+        # Bit i of bitmask[w] is set iff letter i appears in word w
+        self.bitmask = np.bitwise_or.reduce(np.uint32(1) << self.codes.astype(np.uint32), axis=1)
+        # pos_has[w, i, c] is True iff word w has letter c at position i
+        self.pos_has = np.zeros((len(words), self.WORD_LENGTH, 26), dtype=np.bool_)
+        self.pos_has[np.arange(len(words))[:, None], np.arange(self.WORD_LENGTH)[None, :], self.codes] = True
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @classmethod
+    def from_file(cls, path: str):  # -> DictionaryIndex
+        """
+        Loads a dictionary file with a single read and builds the index for its words.
+
+        :param path: Path of the dictionary file, one word per line
+        :return: The DictionaryIndex for the file's words
+        """
+        with open(path, "r", encoding="utf-8") as fi:
+            words = fi.read().lower().split()
+        if any(len(word) != cls.WORD_LENGTH for word in words):
+            raise ValueError(f"Every word in {path} must be {cls.WORD_LENGTH} letters long")
+        return cls(words)
+
+
+class GameState:
+    """
+    Class for keeping track of Wordle game state and providing choices
+    """
+
+    MAX_MONTE_CARLO_SIMILATED_OUTCOMES = 50_000
+    TOTAL_GUESSES = 6
+    HIDDEN_WORD_LENGTH = 5
+    MAX_CONSIDERED_GOOD_GUESSES = 50
+    # Below this many remaining words, scoring the whole dictionary is not worth it
+    SCORE_DICTIONARY_THRESHOLD = 20
+    GAME_LOST_PENALTY_MULTIPLIER = 10
+    LETTER_KNOWN_PENALTY = 0.01
+    DIGIT_TRANSLATION = str.maketrans("", "", "0123456789")
+
+    def __init__(self, dictionary, **kwargs):
+        # The precomputed dictionary structures are immutable and shared by reference, never copied
+        self.dictionary_index = (
+            dictionary if isinstance(dictionary, DictionaryIndex) else DictionaryIndex(dictionary)
+        )
+        self.remaining_mask = kwargs.get("remaining_mask")
+        if self.remaining_mask is None:
+            self.remaining_mask = np.ones(len(self.dictionary_index), dtype=bool)
+        self.total_guesses = kwargs.get("total_guesses", self.TOTAL_GUESSES)
+        self.verbose = kwargs.get("verbose", False)
+        self.excluded_mask = kwargs.get("excluded_mask", 0)
+        self.included_mask = kwargs.get("included_mask", 0)
+        self.letter_positions = kwargs.get("letter_positions")
+        if self.letter_positions is None:
+            # Known position per letter, -1 if unknown
+            self.letter_positions = np.full(26, -1, dtype=np.int8)
+        self.letter_not_positions = kwargs.get("letter_not_positions")
+        if self.letter_not_positions is None:
+            # letter_not_positions[c, i] is True if letter c is known not to be at position i
+            self.letter_not_positions = np.zeros((26, self.HIDDEN_WORD_LENGTH), dtype=np.bool_)
+        # Best-guess candidate pools keyed by state hash, shared across deepcopies
+        self.guess_cache = kwargs.get("guess_cache")
+        if self.guess_cache is None:
+            self.guess_cache = {}
+        self.rng = kwargs.get("rng")
+        if self.rng is None:
+            # Seeded from the random module so random.seed keeps runs reproducible
+            self.rng = np.random.default_rng(random.getrandbits(64))
+        # Guesses stored as dictionary indices in a preallocated array with a cursor
+        self.tried_word_indices = np.full(self.total_guesses + 1, -1, dtype=np.int32)
+        self.try_count = 0
+        self.off_dictionary_tries = {}
+
+    @staticmethod
+    def __letters_to_bitmask(letters) -> int:
+        """
+        Packs a collection of letters into a 26-bit bitmask.
+
+        :param letters: The letters to pack
+        :return: The bitmask with bit i set iff letter i is present
+        """
+        mask = 0
+        for c in letters:
+            mask |= 1 << (ord(c) - ord("a"))
+        return mask
+
+    @staticmethod
+    def __bitmask_to_bool(mask: int) -> np.ndarray:
+        """
+        Unpacks a 26-bit letter bitmask into a boolean array.
+
+        :param mask: The bitmask to unpack
+        :return: Boolean array with element i True iff bit i is set
+        """
+        return ((mask >> np.arange(26)) & 1).astype(np.bool_)
+
+    def __get_word_codes(self, word: str) -> np.ndarray:
+        """
+        Gets the letter codes of a word, shared with the code matrix for dictionary words.
+
+        :param word: The word to get the letter codes of
+        :return: The uint8 array of letter codes
+        """
+        i = self.dictionary_index.word_index.get(word)
+        if i is not None:
+            return self.dictionary_index.codes[i]
+        return np.frombuffer(word.encode(), dtype=np.uint8) - ord("a")
+
+    def __record_try(self, guessed_word: str) -> None:
+        """
+        Records a guessed word at the current try cursor.
+
+        :param guessed_word: The word that was guessed
+        :return: None
+        """
+        word_idx = self.dictionary_index.word_index.get(guessed_word, -1)
+        if word_idx < 0:
+            self.off_dictionary_tries[self.try_count] = guessed_word
+        if self.try_count >= len(self.tried_word_indices):
+            self.tried_word_indices = np.append(self.tried_word_indices, np.int32(-1))
+        self.tried_word_indices[self.try_count] = word_idx
+        self.try_count += 1
+
+    @property
+    def previous_tries(self) -> List[str]:
+        """
+        The words guessed so far.
+
+        :return: The list of guessed words in order
+        """
+        return [
+            self.dictionary_index.words[i] if i >= 0 else self.off_dictionary_tries[slot]
+            for slot, i in enumerate(self.tried_word_indices[: self.try_count])
+        ]
+
+    @property
+    def first_try_word(self) -> str:
+        """
+        The first word guessed this game.
+
+        :return: The first guessed word
+        """
+        i = self.tried_word_indices[0]
+        return self.dictionary_index.words[i] if i >= 0 else self.off_dictionary_tries[0]
+
+    @property
+    def remaining_words(self) -> List[str]:
+        """
+        The words that could still be the hidden word.
+
+        :return: The list of potential hidden words
+        """
+        return [self.dictionary_index.words[i] for i in np.flatnonzero(self.remaining_mask)]
+
+    @property
+    def remaining_count(self) -> int:
+        """
+        The number of words that could still be the hidden word.
+
+        :return: The number of potential hidden words
+        """
+        return int(np.count_nonzero(self.remaining_mask))
+
+    def __get_new_remaining_mask(self, guessed_word: str) -> np.ndarray:
+        """
+        Given the guessed word, remove all words that can no longer be the hidden word.
+
+        :param guessed_word: The word that was guessed
+        :return: The updated boolean mask over the dictionary of potential hidden words
+        """
+        mask = self.remaining_mask.copy()
+        if self.excluded_mask:
+            mask &= (self.dictionary_index.bitmask & np.uint32(self.excluded_mask)) == 0
+        if self.included_mask:
+            included_mask = np.uint32(self.included_mask)
+            mask &= (self.dictionary_index.bitmask & included_mask) == included_mask
+        positioned_letters = np.flatnonzero(self.letter_positions >= 0)
+        if positioned_letters.size:
+            mask &= self.dictionary_index.pos_has[:, self.letter_positions[positioned_letters], positioned_letters].all(axis=1)
+        # if we know an included character is not in a location remove those words
+        if self.letter_not_positions.any():
+            codes = self.dictionary_index.codes
+            mask &= ~self.letter_not_positions[codes, np.arange(self.HIDDEN_WORD_LENGTH)].any(axis=1)
+        guessed_index = self.dictionary_index.word_index.get(guessed_word)
+        if guessed_index is not None:
+            mask[guessed_index] = False
+        return mask
+
+    def is_game_over(self) -> bool:
+        """
+        Checks to see if the game is over.
+
+        :return: True if the game is over, else False
+        """
+        return (
+            self.try_count >= self.total_guesses
+            or int(np.count_nonzero(self.letter_positions >= 0)) == self.HIDDEN_WORD_LENGTH
+        )
+
+    def update_with_text_outcome(self, guessed_word: str, outcome: str) -> None:
+        """
+        Updates the game state given the guessed word and the outcome of that guess.
+        The outcome is a string of a special format. The format is letters for letters that matched and letters followed
+        by a number of the index if the letter matched a position. The index starts from 0 and goes to a maximum of 4.
+
+        Some examples of valid outcome strings would be:
+        stba
+        s0t4b1a
+        st4ba
+
+        :param guessed_word: The word that was guessed
+        :param outcome:  The outcome of that guess
+        :return: None
+        """
+        self.__record_try(guessed_word)
+
+        self.included_mask |= self.__letters_to_bitmask(outcome.translate(self.DIGIT_TRANSLATION))
+        for c in guessed_word:
+            if not self.included_mask & 1 << (ord(c) - ord("a")):
+                self.excluded_mask |= 1 << (ord(c) - ord("a"))
+
+        position_values = ["" for _ in range(self.HIDDEN_WORD_LENGTH)]
+        previous_character = ""
+        for character in outcome:
+            if character.isnumeric():
+                position_values[int(character)] = previous_character
+            previous_character = character
+
+        for i, c in enumerate(guessed_word):
+            code = ord(c) - ord("a")
+            if c == position_values[i]:
+                self.letter_positions[code] = i
+            elif self.included_mask & 1 << code:
+                self.letter_not_positions[code, i] = True
+
+        self.remaining_mask = self.__get_new_remaining_mask(guessed_word)
+
+    def update_with_hidden_word(self, guessed_word: str, hidden_word: str) -> None:
+        """
+        Updates the game state given the guessed word and the known hidden word.
+
+        :param guessed_word: The word that was guessed
+        :param hidden_word: The hidden word you are trying to find
+        :return: None
+        """
+        if self.verbose:
+            print(f"Guessing {guessed_word}")
+
+        self.__record_try(guessed_word)
+
+        guess_codes = self.__get_word_codes(guessed_word)
+        hidden_codes = self.__get_word_codes(hidden_word)
+
+        hidden_presence = np.zeros(26, dtype=np.bool_)
+        hidden_presence[hidden_codes] = True
+        in_hidden = hidden_presence[guess_codes]
+        guess_bits = np.uint32(1) << guess_codes.astype(np.uint32)
+        self.included_mask |= int(np.bitwise_or.reduce(guess_bits[in_hidden]))
+        self.excluded_mask |= int(np.bitwise_or.reduce(guess_bits[~in_hidden]))
+
+        matched = guess_codes == hidden_codes
+        self.letter_positions[guess_codes[matched]] = np.flatnonzero(matched)
+        misplaced = in_hidden & ~matched
+        self.letter_not_positions[guess_codes[misplaced], np.flatnonzero(misplaced)] = True
+
+        self.remaining_mask = self.__get_new_remaining_mask(guessed_word)
+
+    def __get_candidate_pool(self) -> List[str]:
+        """
+        Computes the top-scoring candidate guess words for the current state.
+        The pool is deterministic given the state, so it is cached by state hash and shared
+        across deepcopies; only the final choice between pool words is random.
+
+        :return: The list of candidate guess words
+        """
+        remaining_words = self.remaining_words
+        state_key = hashlib.blake2b(
+            self.remaining_mask.tobytes()
+            + self.letter_positions.tobytes()
+            + self.letter_not_positions.tobytes()
+            + self.included_mask.to_bytes(4, "little")
+            + (self.total_guesses - self.try_count).to_bytes(2, "little", signed=True),
+            digest_size=16,
+        ).digest()
+        cached_solution_words = self.guess_cache.get(state_key)
+        if cached_solution_words is not None:
+            return cached_solution_words
+
+        character_counts = np.bincount(self.dictionary_index.codes[self.remaining_mask].ravel(), minlength=26).astype(
+            np.float64
+        )
+        remaining_letter_count = int(np.count_nonzero(character_counts))
+
+        included = self.__bitmask_to_bool(self.included_mask)
+        included_count = int(np.count_nonzero(included))
+        positioned = self.letter_positions >= 0
+        # We gain no new information from included letters with positions
+        character_counts[included & positioned] = 0
+        # We gain some information from included letters with no positions
+        character_counts[included & ~positioned] *= self.LETTER_KNOWN_PENALTY
+
+        character_scores = character_counts / max(1, character_counts.max())
+        # Score every word as the sum of the scores of its distinct letters
+        word_scores = self.dictionary_index.presence_bool @ character_scores
+
+        if (
+            (remaining_letter_count != included_count)
+            and (self.total_guesses > self.try_count + 1)
+            and len(remaining_words) > self.SCORE_DICTIONARY_THRESHOLD
+        ):
+            candidate_indices = None
+            candidate_scores = word_scores
+        else:
+            candidate_indices = np.flatnonzero(self.remaining_mask)
+            candidate_scores = word_scores[candidate_indices]
+
+        top_k = max(min(math.ceil(len(remaining_words) / 5), self.MAX_CONSIDERED_GOOD_GUESSES), 5)
+        if top_k < len(candidate_scores):
+            top_indices = np.argpartition(candidate_scores, -top_k)[-top_k:]
+        else:
+            top_indices = np.arange(len(candidate_scores))
+        if candidate_indices is not None:
+            top_indices = candidate_indices[top_indices]
+
+        solution_words = self.dictionary_index.words_array[top_indices].tolist()
+        if len(remaining_words) <= 5:
+            solution_words = list(set(solution_words) | set(remaining_words))
+
+        self.guess_cache[state_key] = solution_words
+        return solution_words
+
+    def get_best_guess(self) -> str:
+        """
+        Gets the best guess given the algorithm.
+        The algorithm takes the letters remaining in all the words that could potentially be the hidden word. It
+        counts all the letters and then creates a weighted score for all letters based on letters remaining and
+        the amount of information gain for each letter. It then takes the top X words in the entire dictionary based
+        on the letter scoring and randomly selects one of them as the best guess.
+
+        :return:
+        """
+        remaining_words = self.remaining_words
+        if len(remaining_words) <= 2:
+            return random.choice(remaining_words)
+        return random.choice(self.__get_candidate_pool())
+
+    def __state_arrays(self):
+        """
+        Packs the letter knowledge into flat NumPy arrays for the compiled rollout kernels.
+
+        :return: Tuple of (excluded, included, position, not-position) arrays
+        """
+        return (
+            self.__bitmask_to_bool(self.excluded_mask),
+            self.__bitmask_to_bool(self.included_mask),
+            self.letter_positions,
+            self.letter_not_positions,
+        )
+
+    def deepcopy(self):  # -> GameState
+        """
+        Returns a deep copy of the game state for certain member variables.
+
+        :return: Deep copy of a portion of the GameState
+        """
+        return GameState(
+            self.dictionary_index,
+            remaining_mask=self.remaining_mask.copy(),
+            total_guesses=self.total_guesses - self.try_count,
+            excluded_mask=self.excluded_mask,
+            included_mask=self.included_mask,
+            letter_positions=self.letter_positions.copy(),
+            letter_not_positions=self.letter_not_positions.copy(),
+            guess_cache=self.guess_cache,
+            rng=self.rng,
+        )
+
+    def get_percentage_chance_of_winning(self, guess_word, number_of_simulations=2000):
+        """
+        If the given guess word used next, what is the percentage chance of winning the game. This is calculated using
+        X number of game simulations with randomly selected hidden words from the remaining hidden words.
+
+        :param guess_word: The guess word
+        :param number_of_simulations: The number of times we want to simulate the outcome
+        :return: The win rate percentage
+        """
+        remaining_count = self.remaining_count
+        if remaining_count == 0:
+            return 0.0
+        if remaining_count <= 2:
+            # With at most two candidates the outcome is forced; no need to simulate
+            guesses_left = self.total_guesses - self.try_count
+            if guess_word not in self.remaining_words:
+                guesses_left -= 1
+            return min(1.0, max(guesses_left, 0) / remaining_count)
+
+        if rollout is not None:
+            remaining_indices = np.flatnonzero(self.remaining_mask)
+            hidden_indices = remaining_indices[
+                self.rng.integers(0, remaining_indices.size, number_of_simulations)
+            ]
+            seeds = self.rng.integers(0, 2**32, number_of_simulations, dtype=np.uint32)
+            guess_idx = self.dictionary_index.word_index.get(guess_word, -1)
+            guess_codes = self.__get_word_codes(guess_word)
+            excluded, included, pos, not_pos = self.__state_arrays()
+            wins = rollout.simulate_win_rate(
+                self.dictionary_index.codes,
+                self.dictionary_index.presence,
+                self.remaining_mask,
+                excluded,
+                included,
+                pos,
+                not_pos,
+                self.total_guesses - self.try_count,
+                guess_codes,
+                guess_idx,
+                hidden_indices,
+                seeds,
+                self.MAX_CONSIDERED_GOOD_GUESSES,
+                self.LETTER_KNOWN_PENALTY,
+                self.SCORE_DICTIONARY_THRESHOLD,
+            )
+            return wins / number_of_simulations
+
+        remaining_words = self.remaining_words
+        hidden_choices = self.rng.integers(0, len(remaining_words), number_of_simulations)
+        outcomes = []
+        for hidden_choice in hidden_choices:
+            hidden_word = remaining_words[hidden_choice]
+            if guess_word == hidden_word:
+                outcomes.append(True)
+                continue
+
+            monte_carlo_game_state = self.deepcopy()
+
+            monte_carlo_game_state.update_with_hidden_word(guess_word, hidden_word)
+            while not monte_carlo_game_state.is_game_over():
+                best_guess = monte_carlo_game_state.get_best_guess()
+                monte_carlo_game_state.update_with_hidden_word(best_guess, hidden_word)
+                if best_guess == hidden_word:
+                    outcomes.append(True)
+                    break
+            else:
+                outcomes.append(False)
+        return sum(outcomes) / len(outcomes)
+
+    def get_monte_carlo_choices(self, limit=5):
+        """
+        Gets the top X word choices for the current game state. This is calculated using Monte Carlo.
+
+        :param limit: The number of choices to return
+        :return: The list of word choices with the percentage chance of a win.
+        """
+
+        if self.try_count == 0:
+            return [
+                (3.959705882352941, "dates"),
+                (3.970299884659746, "dales"),
+                (3.971229293809939, "dares"),
+                (3.984014209591474, "lanes"),
+                (3.988081725312145, "rates"),
+            ]
+
+        remaining_count = self.remaining_count
+        if remaining_count == 0:
+            return []
+        if remaining_count <= 2:
+            # With at most two candidates the choice is forced; no need to simulate
+            expected_tries = self.try_count + 2 - 1 / remaining_count
+            return [(expected_tries, word) for word in self.remaining_words][:limit]
+
+        number_of_simulations = min(remaining_count * 50, self.MAX_MONTE_CARLO_SIMILATED_OUTCOMES)
+        if rollout is not None:
+            remaining_indices = np.flatnonzero(self.remaining_mask)
+            hidden_indices = remaining_indices[
+                self.rng.integers(0, remaining_indices.size, number_of_simulations)
+            ]
+            seeds = self.rng.integers(0, 2**32, number_of_simulations, dtype=np.uint32)
+            excluded, included, pos, not_pos = self.__state_arrays()
+            first_guesses, turns, wins = rollout.simulate_choices(
+                self.dictionary_index.codes,
+                self.dictionary_index.presence,
+                self.remaining_mask,
+                excluded,
+                included,
+                pos,
+                not_pos,
+                self.total_guesses - self.try_count,
+                hidden_indices,
+                seeds,
+                self.MAX_CONSIDERED_GOOD_GUESSES,
+                self.LETTER_KNOWN_PENALTY,
+                self.SCORE_DICTIONARY_THRESHOLD,
+            )
+            valid = first_guesses >= 0
+            first_guesses = first_guesses[valid]
+            scores = (turns[valid] + self.try_count).astype(np.float64)
+            scores[~wins[valid]] *= self.GAME_LOST_PENALTY_MULTIPLIER
+            score_sums = np.zeros(len(self.dictionary_index))
+            score_counts = np.zeros(len(self.dictionary_index), dtype=np.int64)
+            np.add.at(score_sums, first_guesses, scores)
+            np.add.at(score_counts, first_guesses, 1)
+            chosen = np.flatnonzero(score_counts)
+            means = score_sums[chosen] / score_counts[chosen]
+            if limit < means.size:
+                top = np.argpartition(means, limit)[:limit]
+                chosen = chosen[top]
+                means = means[top]
+            return [
+                (float(means[i]), self.dictionary_index.words[chosen[i]]) for i in np.argsort(means)
+            ]
+
+        remaining_words = self.remaining_words
+        hidden_choices = self.rng.integers(0, len(remaining_words), number_of_simulations)
+        choice_score_sums = defaultdict(float)
+        choice_counts = defaultdict(int)
+        for hidden_choice in hidden_choices:
+            hidden_word = remaining_words[hidden_choice]
+            monte_carlo_game_state = self.deepcopy()
+            won = False
+            while not monte_carlo_game_state.is_game_over():
+                best_guess = monte_carlo_game_state.get_best_guess()
+                monte_carlo_game_state.update_with_hidden_word(best_guess, hidden_word)
+                if best_guess == hidden_word:
+                    won = True
+                    break
+            score = monte_carlo_game_state.try_count + self.try_count
+            if not won:
+                score *= self.GAME_LOST_PENALTY_MULTIPLIER
+            choice_score_sums[monte_carlo_game_state.first_try_word] += score
+            choice_counts[monte_carlo_game_state.first_try_word] += 1
+
+        return sorted((choice_score_sums[word] / choice_counts[word], word) for word in choice_counts)[:limit]
+
+    def get_monte_carlo_choice(self):
+        """
+        Gets the top monte carlo word choice given the current game state.
+
+        :return: Word with the top win rate given the current game state
+        """
+        return self.get_monte_carlo_choices(limit=1)[0][1]
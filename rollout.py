@@ -0,0 +1,335 @@
+"""Numba-compiled Monte Carlo rollout kernels operating on integer-coded words"""
+import numpy as np
+from numba import njit, prange
+
+WORD_LENGTH = 5
+ALPHABET_SIZE = 26
+
+
+@njit(cache=True)
+def _filter_mask(word_codes, presence, mask, excluded, included, pos, not_pos, guess_idx):
+    """
+    Removes every word from the mask that can no longer be the hidden word.
+
+    :param word_codes: The (N, 5) uint8 letter-code matrix for the dictionary
+    :param presence: The (N, 26) uint8 letter-count matrix for the dictionary
+    :param mask: The boolean mask of remaining words, updated in place
+    :param excluded: Boolean array of letters known not to be in the hidden word
+    :param included: Boolean array of letters known to be in the hidden word
+    :param pos: Known position per letter, -1 if unknown
+    :param not_pos: (26, 5) boolean array of positions a letter is known not to be in
+    :param guess_idx: Dictionary index of the guessed word, -1 if not in the dictionary
+    :return: None
+    """
+    number_of_words = word_codes.shape[0]
+    for i in range(number_of_words):
+        if not mask[i]:
+            continue
+        if i == guess_idx:
+            mask[i] = False
+            continue
+        keep = True
+        for c in range(ALPHABET_SIZE):
+            if excluded[c] and presence[i, c] > 0:
+                keep = False
+                break
+            if included[c] and presence[i, c] == 0:
+                keep = False
+                break
+            if pos[c] >= 0 and word_codes[i, pos[c]] != c:
+                keep = False
+                break
+        if keep:
+            for j in range(WORD_LENGTH):
+                if not_pos[word_codes[i, j], j]:
+                    keep = False
+                    break
+        mask[i] = keep
+
+
+@njit(cache=True)
+def _update_with_hidden_word(word_codes, presence, mask, excluded, included, pos, not_pos, guess_codes, guess_idx, hidden_idx):
+    """
+    Updates the letter knowledge and remaining mask given the guessed word and the known hidden word.
+
+    :param guess_codes: Letter codes of the guessed word
+    :param guess_idx: Dictionary index of the guessed word, -1 if not in the dictionary
+    :param hidden_idx: Dictionary index of the hidden word
+    :return: None
+    """
+    for j in range(WORD_LENGTH):
+        c = guess_codes[j]
+        if presence[hidden_idx, c] > 0:
+            included[c] = True
+        else:
+            excluded[c] = True
+    for j in range(WORD_LENGTH):
+        c = guess_codes[j]
+        if c == word_codes[hidden_idx, j]:
+            pos[c] = j
+        elif included[c]:
+            not_pos[c, j] = True
+    _filter_mask(word_codes, presence, mask, excluded, included, pos, not_pos, guess_idx)
+
+
+@njit(cache=True)
+def _outcome_codes(word_codes, presence, guess_codes):
+    """
+    Computes the outcome of playing a guess against every dictionary word as the hidden word,
+    packed as 2 bits per position (0 = gray, 1 = yellow, 2 = green).
+
+    :param guess_codes: Letter codes of the guessed word
+    :return: uint16 array with the packed outcome per dictionary word
+    """
+    number_of_words = word_codes.shape[0]
+    outcomes = np.zeros(number_of_words, np.uint16)
+    for i in range(number_of_words):
+        outcome = 0
+        for j in range(WORD_LENGTH):
+            c = guess_codes[j]
+            if word_codes[i, j] == c:
+                outcome |= 2 << (2 * j)
+            elif presence[i, c] > 0:
+                outcome |= 1 << (2 * j)
+        outcomes[i] = outcome
+    return outcomes
+
+
+@njit(cache=True)
+def _positioned_letter_count(pos):
+    """
+    Counts the letters with a known position.
+
+    :param pos: Known position per letter, -1 if unknown
+    :return: The number of positioned letters
+    """
+    count = 0
+    for c in range(ALPHABET_SIZE):
+        if pos[c] >= 0:
+            count += 1
+    return count
+
+
+@njit(cache=True)
+def _best_guess(word_codes, presence, mask, included, pos, guesses_left, tries, max_considered, letter_known_penalty, score_dictionary_threshold):
+    """
+    Picks the next guess with the same letter-scoring algorithm as GameState.get_best_guess.
+
+    :param guesses_left: Total guesses available for this rollout
+    :param tries: Guesses already made in this rollout
+    :param max_considered: Maximum size of the top-scoring candidate pool
+    :param letter_known_penalty: Score multiplier for letters known to be included
+    :param score_dictionary_threshold: Remaining-word count below which only remaining words are scored
+    :return: Dictionary index of the chosen guess, -1 if no words remain
+    """
+    number_of_words = word_codes.shape[0]
+    remaining_count = 0
+    for i in range(number_of_words):
+        if mask[i]:
+            remaining_count += 1
+    if remaining_count == 0:
+        return -1
+    if remaining_count <= 2:
+        target = np.random.randint(0, remaining_count)
+        seen = 0
+        for i in range(number_of_words):
+            if mask[i]:
+                if seen == target:
+                    return i
+                seen += 1
+
+    counts = np.zeros(ALPHABET_SIZE, np.float64)
+    for i in range(number_of_words):
+        if mask[i]:
+            for j in range(WORD_LENGTH):
+                counts[word_codes[i, j]] += 1.0
+
+    remaining_letter_count = 0
+    for c in range(ALPHABET_SIZE):
+        if counts[c] > 0:
+            remaining_letter_count += 1
+
+    included_count = 0
+    for c in range(ALPHABET_SIZE):
+        if included[c]:
+            included_count += 1
+            if pos[c] >= 0:
+                counts[c] = 0.0
+            else:
+                counts[c] *= letter_known_penalty
+
+    scale = counts.max()
+    if scale < 1.0:
+        scale = 1.0
+
+    scores = np.empty(number_of_words, np.float64)
+    for i in range(number_of_words):
+        score = 0.0
+        for j in range(WORD_LENGTH):
+            c = word_codes[i, j]
+            duplicate = False
+            for j2 in range(j):
+                if word_codes[i, j2] == c:
+                    duplicate = True
+                    break
+            if not duplicate:
+                score += counts[c] / scale
+        scores[i] = score
+
+    if remaining_letter_count != included_count and guesses_left > tries + 1 and remaining_count > score_dictionary_threshold:
+        candidate_indices = np.arange(number_of_words)
+        candidate_scores = scores
+    else:
+        candidate_indices = np.flatnonzero(mask)
+        candidate_scores = scores[candidate_indices]
+
+    top_k = (remaining_count + 4) // 5
+    if top_k > max_considered:
+        top_k = max_considered
+    if top_k < 5:
+        top_k = 5
+    if top_k > candidate_scores.shape[0]:
+        top_k = candidate_scores.shape[0]
+    order = np.argsort(candidate_scores)
+    pool = candidate_indices[order[candidate_scores.shape[0] - top_k:]]
+
+    if remaining_count <= 5:
+        remaining_indices = np.flatnonzero(mask)
+        merged = np.empty(pool.shape[0] + remaining_indices.shape[0], np.int64)
+        merged_count = 0
+        for i in range(pool.shape[0]):
+            merged[merged_count] = pool[i]
+            merged_count += 1
+        for i in range(remaining_indices.shape[0]):
+            duplicate = False
+            for j in range(pool.shape[0]):
+                if pool[j] == remaining_indices[i]:
+                    duplicate = True
+                    break
+            if not duplicate:
+                merged[merged_count] = remaining_indices[i]
+                merged_count += 1
+        pool = merged[:merged_count]
+
+    return pool[np.random.randint(0, pool.shape[0])]
+
+
+@njit(cache=True)
+def _play_out(word_codes, presence, mask, excluded, included, pos, not_pos, hidden_idx, guesses_left, tries, max_considered, letter_known_penalty, score_dictionary_threshold):
+    """
+    Plays a single game to completion from the given state.
+
+    :return: Tuple of (first guess dictionary index, total tries used, True if the hidden word was guessed)
+    """
+    first_guess = -1
+    won = False
+    while tries < guesses_left and _positioned_letter_count(pos) < WORD_LENGTH:
+        guess_idx = _best_guess(
+            word_codes, presence, mask, included, pos, guesses_left, tries, max_considered, letter_known_penalty, score_dictionary_threshold
+        )
+        if guess_idx < 0:
+            break
+        if first_guess < 0:
+            first_guess = guess_idx
+        _update_with_hidden_word(
+            word_codes, presence, mask, excluded, included, pos, not_pos, word_codes[guess_idx], guess_idx, hidden_idx
+        )
+        tries += 1
+        if guess_idx == hidden_idx:
+            won = True
+            break
+    return first_guess, tries, won
+
+
+@njit(cache=True, parallel=True)
+def simulate_win_rate(word_codes, presence, mask, excluded, included, pos, not_pos, guesses_left, guess_codes, guess_idx, hidden_indices, seeds, max_considered, letter_known_penalty, score_dictionary_threshold):
+    """
+    Counts the games won when the given guess is played next against each sampled hidden word.
+    The state after the first guess is a pure function of its outcome, so hidden words producing
+    the same outcome share one precomputed post-guess state instead of re-running the update.
+
+    :param hidden_indices: Dictionary index of the hidden word for each simulation
+    :param seeds: RNG seed for each simulation, so results do not depend on thread scheduling
+    :return: The number of simulations won
+    """
+    number_of_words = word_codes.shape[0]
+    outcome_row = _outcome_codes(word_codes, presence, guess_codes)
+    number_of_outcomes = 4 ** WORD_LENGTH
+    cache_valid = np.zeros(number_of_outcomes, np.bool_)
+    cache_mask = np.zeros((number_of_outcomes, number_of_words), np.bool_)
+    cache_excluded = np.zeros((number_of_outcomes, ALPHABET_SIZE), np.bool_)
+    cache_included = np.zeros((number_of_outcomes, ALPHABET_SIZE), np.bool_)
+    cache_pos = np.zeros((number_of_outcomes, ALPHABET_SIZE), np.int8)
+    cache_not_pos = np.zeros((number_of_outcomes, ALPHABET_SIZE, WORD_LENGTH), np.bool_)
+    for s in range(hidden_indices.shape[0]):
+        hidden_idx = hidden_indices[s]
+        outcome = outcome_row[hidden_idx]
+        if cache_valid[outcome]:
+            continue
+        sim_mask = mask.copy()
+        sim_excluded = excluded.copy()
+        sim_included = included.copy()
+        sim_pos = pos.copy()
+        sim_not_pos = not_pos.copy()
+        _update_with_hidden_word(
+            word_codes, presence, sim_mask, sim_excluded, sim_included, sim_pos, sim_not_pos, guess_codes, guess_idx, hidden_idx
+        )
+        cache_mask[outcome] = sim_mask
+        cache_excluded[outcome] = sim_excluded
+        cache_included[outcome] = sim_included
+        cache_pos[outcome] = sim_pos
+        cache_not_pos[outcome] = sim_not_pos
+        cache_valid[outcome] = True
+
+    wins = 0
+    for s in prange(hidden_indices.shape[0]):
+        hidden_idx = hidden_indices[s]
+        if guess_idx >= 0 and guess_idx == hidden_idx:
+            wins += 1
+            continue
+        np.random.seed(seeds[s])
+        outcome = outcome_row[hidden_idx]
+        _, _, won = _play_out(
+            word_codes,
+            presence,
+            cache_mask[outcome].copy(),
+            cache_excluded[outcome].copy(),
+            cache_included[outcome].copy(),
+            cache_pos[outcome].copy(),
+            cache_not_pos[outcome].copy(),
+            hidden_idx,
+            guesses_left,
+            1,
+            max_considered,
+            letter_known_penalty,
+            score_dictionary_threshold,
+        )
+        if won:
+            wins += 1
+    return wins
+
+
+@njit(cache=True, parallel=True)
+def simulate_choices(word_codes, presence, mask, excluded, included, pos, not_pos, guesses_left, hidden_indices, seeds, max_considered, letter_known_penalty, score_dictionary_threshold):
+    """
+    Plays one full game per sampled hidden word and records how each opening choice performed.
+
+    :param hidden_indices: Dictionary index of the hidden word for each simulation
+    :param seeds: RNG seed for each simulation, so results do not depend on thread scheduling
+    :return: Tuple of (first guess index, tries used, won) arrays, one entry per simulation
+    """
+    number_of_simulations = hidden_indices.shape[0]
+    first_guesses = np.full(number_of_simulations, -1, np.int64)
+    turns = np.zeros(number_of_simulations, np.int64)
+    wins = np.zeros(number_of_simulations, np.bool_)
+    for s in prange(number_of_simulations):
+        np.random.seed(seeds[s])
+        sim_mask = mask.copy()
+        sim_excluded = excluded.copy()
+        sim_included = included.copy()
+        sim_pos = pos.copy()
+        sim_not_pos = not_pos.copy()
+        first_guesses[s], turns[s], wins[s] = _play_out(
+            word_codes, presence, sim_mask, sim_excluded, sim_included, sim_pos, sim_not_pos, hidden_indices[s], guesses_left, 0, max_considered, letter_known_penalty, score_dictionary_threshold
+        )
+    return first_guesses, turns, wins
@@ -1,8 +1,9 @@
 """Simulates many potential Wordle puzzles and solves them using Monte Carlo"""
 import random
-from collections import defaultdict
 
-from gamestate import GameState
+import numpy as np
+
+from gamestate import DictionaryIndex, GameState
 
 random.seed(1174321)
 
@@ -15,30 +16,36 @@ def main(times_to_play=5000) -> None:
     :return: None
     """
 
-    with open("dictionary.txt", "r", encoding="utf-8") as fi:
-        words = [w.strip().lower() for w in fi.readlines()]
+    dictionary_index = DictionaryIndex.from_file("dictionary.txt")
+    words = dictionary_index.words
 
-    choice_outcomes = defaultdict(list)
+    # Per-choice outcomes accumulated into flat arrays indexed by word
+    choice_turn_sums = np.zeros(len(words), dtype=np.float64)
+    choice_win_counts = np.zeros(len(words), dtype=np.int64)
+    choice_counts = np.zeros(len(words), dtype=np.int64)
     turns_to_win = []
     misses = set()
     for i in range(times_to_play):
         hidden_word = random.choice(words)
         print(f"Hidden word is: {hidden_word}")
-        game_state = GameState(words, verbose=True)
+        game_state = GameState(dictionary_index, verbose=True)
         while not game_state.is_game_over():
             best_guess = game_state.get_monte_carlo_choice()
             game_state.update_with_hidden_word(best_guess, hidden_word)
             if best_guess == hidden_word:
                 print("Guessed correctly!")
-                turns_to_win.append(len(game_state.previous_tries))
+                turns_to_win.append(game_state.try_count)
                 break
         else:
             turns_to_win.append(None)
             misses.add(hidden_word)
             print(f"Failed to guess '{hidden_word}'")
 
-        for word in game_state.previous_tries:
-            choice_outcomes[word].append(turns_to_win[-1])
+        tried_indices = game_state.tried_word_indices[: game_state.try_count]
+        np.add.at(choice_counts, tried_indices, 1)
+        if turns_to_win[-1] is not None:
+            np.add.at(choice_turn_sums, tried_indices, turns_to_win[-1])
+            np.add.at(choice_win_counts, tried_indices, 1)
 
         if i % 100 == 0:
             exclude_losses = [v for v in turns_to_win if v is not None]
@@ -50,9 +57,9 @@ def main(times_to_play=5000) -> None:
     print(sum(exclude_losses) / len(exclude_losses))
     print(
         [
-            (k, sum(choice_outcomes[k]) / len(choice_outcomes[k]))
-            for k in choice_outcomes
-            if len(choice_outcomes[k]) >= times_to_play / 50
+            (words[k], float(choice_turn_sums[k] / choice_win_counts[k]))
+            for k in np.flatnonzero(choice_counts >= times_to_play / 50)
+            if choice_win_counts[k]
         ]
     )
     print(f"The misses were: {misses}")
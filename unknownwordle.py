@@ -1,7 +1,7 @@
 """Helps solve unknown Wordle puzzles and gives statistical information on choices."""
 import random
 
-from gamestate import GameState
+from gamestate import DictionaryIndex, GameState
 
 random.seed(1174321)
 
@@ -13,11 +13,10 @@ def main() -> None:
     :return:
     """
 
-    with open("dictionary.txt", "r", encoding="utf-8") as fi:
-        words = [w.strip().lower() for w in fi.readlines()]
+    dictionary_index = DictionaryIndex.from_file("dictionary.txt")
 
     while True:
-        game_state = GameState(words)
+        game_state = GameState(dictionary_index)
 
         print("You need to add the output result of each round. Example of output is:")
         print("r0t2a means 'r' in the first spot, 't' in the 3rd spot and 'a' is in the result.")